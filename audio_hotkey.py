@@ -6,11 +6,12 @@ Listens for a global keyboard hotkey and plays an audio file
 
 import os
 import sys
-import yaml
 import platform
+import queue
+import signal
+import threading
 from pathlib import Path
 from pynput import keyboard
-from pygame import mixer
 
 
 class AudioHotkey:
@@ -20,8 +21,15 @@ class AudioHotkey:
         self.setup_audio()
         self.parse_keybind()
 
+        # Playback runs on its own thread so the keyboard hook never waits on
+        # the mixer; the bound stops a held key from piling up requests
+        self._play_queue = queue.Queue(maxsize=8)
+        threading.Thread(target=self._audio_worker, daemon=True).start()
+
     def load_config(self, config_path):
         """Load configuration from YAML file"""
+        import yaml
+
         try:
             with open(config_path, "r") as f:
                 config = yaml.safe_load(f)
@@ -36,6 +44,9 @@ class AudioHotkey:
     def setup_audio(self):
         """Initialize pygame mixer for audio playback"""
         try:
+            # Imported here: pygame brings up SDL, the slowest import by far
+            from pygame import mixer
+
             mixer.init()
             audio_file = self.config.get("audio_file", "fah.mp3")
 
@@ -51,6 +62,9 @@ class AudioHotkey:
                 sys.exit(1)
 
             self.audio_file = audio_file
+            self.audio_basename = os.path.basename(audio_file)
+            # Decode once; each play() gets its own channel so overlap still works
+            self._sound = mixer.Sound(audio_file)
             print(f"Audio file loaded: {audio_file}")
         except Exception as e:
             print(f"Error initializing audio: {e}")
@@ -93,24 +107,20 @@ class AudioHotkey:
         self.keybind_display = "+".join(modifier_names + [key.upper()])
 
     def play_audio(self):
-        """Play the audio file (non-blocking, allows overlapping)"""
+        """Queue the audio for playback (non-blocking, allows overlapping)"""
         try:
-            # Create a new sound object for each playback to allow overlapping
-            sound = mixer.Sound(self.audio_file)
-            sound.play()
-            print(f"Playing audio: {os.path.basename(self.audio_file)}")
-        except Exception as e:
-            print(f"Error playing audio: {e}")
-
-    def on_press(self, key):
-        """Handle key press events"""
-        # canonical() normalises the key (e.g. Ctrl+F -> F) so HotKey can
-        # match it correctly regardless of which modifiers are held.
-        self.hotkey.press(self._listener.canonical(key))
-
-    def on_release(self, key):
-        """Handle key release events"""
-        self.hotkey.release(self._listener.canonical(key))
+            self._play_queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def _audio_worker(self):
+        """Play queued requests off the keyboard listener thread"""
+        while True:
+            self._play_queue.get()
+            try:
+                self._sound.play()
+            except Exception as e:
+                print(f"Error playing audio: {e}")
 
     def run(self):
         """Start the global keyboard listener"""
@@ -119,7 +129,7 @@ class AudioHotkey:
         print(f"{'=' * 50}")
         print(f"Platform: {platform.system()}")
         print(f"Hotkey: {self.keybind_display}")
-        print(f"Audio file: {os.path.basename(self.audio_file)}")
+        print(f"Audio file: {self.audio_basename}")
         print(f"\nPress {self.keybind_display} to play audio")
         print(f"Press Ctrl+C to stop")
         print(f"{'=' * 50}\n")
@@ -129,19 +139,30 @@ class AudioHotkey:
             print("Note: On macOS, you may need to grant Accessibility permissions")
             print("to Terminal or Python in System Preferences > Security & Privacy\n")
 
-        # Start the keyboard listener
-        with keyboard.Listener(
-            on_press=self.on_press, on_release=self.on_release
-        ) as listener:
-            self._listener = listener  # needed for canonical() in callbacks
-            try:
-                # join() with a timeout loops so the main thread stays
-                # responsive to KeyboardInterrupt (Ctrl+C) on Linux.
+        # Bind the per-event calls up front so each keystroke is one closure
+        # call rather than a chain of attribute lookups on self
+        press, release = self.hotkey.press, self.hotkey.release
+        listener = keyboard.Listener(
+            on_press=lambda key: press(canonical(key)),
+            on_release=lambda key: release(canonical(key)),
+        )
+        # canonical() normalises the key (e.g. Ctrl+F -> F) so HotKey can
+        # match it correctly regardless of which modifiers are held.
+        canonical = listener.canonical
+
+        with listener:
+            # Ctrl+C stops the listener, which is what ends the join below
+            signal.signal(signal.SIGINT, lambda *_: listener.stop())
+            if platform.system() == "Windows":
+                # A blocking join can't be interrupted on Windows, so wake up
+                # periodically to let the SIGINT handler run
                 while listener.is_alive():
                     listener.join(timeout=1.0)
-            except KeyboardInterrupt:
-                print("\n\nStopping Audio Hotkey Player...")
-                print("Goodbye!")
+            else:
+                listener.join()
+
+        print("\n\nStopping Audio Hotkey Player...")
+        print("Goodbye!")
 
 
 def main():
@@ -6,14 +6,23 @@ Listens for a global keyboard hotkey and plays an audio file
 
 import os
 import sys
-import yaml
+import json
+import array
+import itertools
 import platform
+import shutil
+import signal
 import subprocess
+import tempfile
 import threading
+import time
+from collections import deque
 from pathlib import Path
-from pynput import keyboard
 
 # pythonw.exe sets stdout/stderr to None -- redirect to devnull to avoid crashes
+# and skip building messages nobody will see
+_QUIET = sys.stdout is None
+_log = (lambda *args, **kwargs: None) if _QUIET else print
 if sys.stdout is None:
     sys.stdout = open(os.devnull, "w")
 if sys.stderr is None:
@@ -27,109 +36,626 @@ if _SYSTEM == "Windows":
 else:
     CONFIG_DIR = Path.home() / ".config" / "fah"
 
-# -- Windows audio via winmm.dll MCI (no subprocess, no window flash) ----------
+# Fixed paths inside the config directory, joined once
+_CONFIG_PATH = CONFIG_DIR / "config.yaml"
+_CONFIG_CACHE_PATH = CONFIG_DIR / "config.cache.json"
+_PLAYER_CACHE_PATH = CONFIG_DIR / ".player_cache"
+_DEFAULT_AUDIO_PATH = CONFIG_DIR / "fah.mp3"
+
+# Linux players in order of preference, with their extra arguments. mpv comes
+# first: the playback worker keeps it running and replays over IPC.
+_LINUX_PLAYERS = [
+    ("mpv", ["--no-video"]),
+    ("paplay", []),
+    ("aplay", []),
+    ("ffplay", ["-nodisp", "-autoexit"]),
+    ("mpg123", []),
+]
+
+# Config modifier names -> pynput hotkey string tokens
+_MODIFIER_TOKEN_MAP = {
+    "ctrl": "<ctrl>",
+    "alt": "<alt>",
+    "shift": "<shift>",
+    "cmd": "<cmd>",
+    "win": "<cmd>",
+}
+
+# -- Windows audio via winmm.dll (no subprocess, no window flash) ---------------
 if _SYSTEM == "Windows":
-    import ctypes
-
-    _winmm = ctypes.windll.winmm
-    _mciSend = _winmm.mciSendStringW
-    _mci_counter = 0
-    _mci_lock = threading.Lock()
-
-    def _win_play(filepath):
-        """Play an audio file via MCI. Blocks until playback finishes."""
-        global _mci_counter
-        with _mci_lock:
-            _mci_counter += 1
-            alias = f"fah{_mci_counter}"
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The file is opened once on several devices (waveOut for PCM WAV, MCI
+    # aliases otherwise) that are played round-robin, so presses overlap
+    # without paying for open/close each time
+    _WIN_POOL_SIZE = 4
+    # Every winmm call goes through this one long-lived thread: presses no
+    # longer start a thread each, and the devices are always driven from
+    # the thread that opened them
+    _play_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fah-play")
+    _mciSend = None
+    _mciSendA = None
+    _mci_commands = []  # prebuilt (seek, play) ASCII commands per alias
+    _winmm = None
+    _wave_out = []  # (handle, header pointer, header size) per waveOut device
+    _wave_data = None  # PCM buffer shared by every waveOut header
+    _mci_counter = itertools.count()  # next() is atomic, no lock needed
+
+    def _get_mci():
+        """Return winmm's mciSendStringW, importing ctypes on first use"""
+        global _mciSend, _mciSendA
+        if _mciSend is None:
+            import ctypes
+
+            _mciSend = ctypes.windll.winmm.mciSendStringW
+            # Declared once so ctypes doesn't infer argument types per call
+            _mciSend.argtypes = (
+                ctypes.c_wchar_p,
+                ctypes.c_wchar_p,
+                ctypes.c_uint,
+                ctypes.c_void_p,
+            )
+            _mciSend.restype = ctypes.c_uint
+            # ANSI variant for the fixed ASCII commands sent on each press:
+            # bytes go straight through with no UTF-16 conversion
+            _mciSendA = ctypes.windll.winmm.mciSendStringA
+            _mciSendA.argtypes = (
+                ctypes.c_char_p,
+                ctypes.c_char_p,
+                ctypes.c_uint,
+                ctypes.c_void_p,
+            )
+            _mciSendA.restype = ctypes.c_uint
+        return _mciSend
+
+    def _wave_open(filepath):
+        """Preload a PCM WAV file and open a pool of waveOut devices for it"""
+        global _winmm, _wave_data
+        import ctypes
+        import wave
+        from ctypes import wintypes
+
+        try:
+            with wave.open(filepath, "rb") as w:
+                nchannels = w.getnchannels()
+                sampwidth = w.getsampwidth()
+                rate = w.getframerate()
+                frames = w.readframes(w.getnframes())
+        except (wave.Error, EOFError):
+            # Not a PCM WAV file (e.g. MP3): leave it to MCI
+            return False
+
+        class WAVEFORMATEX(ctypes.Structure):
+            _fields_ = [
+                ("wFormatTag", wintypes.WORD),
+                ("nChannels", wintypes.WORD),
+                ("nSamplesPerSec", wintypes.DWORD),
+                ("nAvgBytesPerSec", wintypes.DWORD),
+                ("nBlockAlign", wintypes.WORD),
+                ("wBitsPerSample", wintypes.WORD),
+                ("cbSize", wintypes.WORD),
+            ]
+
+        class WAVEHDR(ctypes.Structure):
+            _fields_ = [
+                ("lpData", ctypes.c_void_p),
+                ("dwBufferLength", wintypes.DWORD),
+                ("dwBytesRecorded", wintypes.DWORD),
+                ("dwUser", ctypes.c_size_t),
+                ("dwFlags", wintypes.DWORD),
+                ("dwLoops", wintypes.DWORD),
+                ("lpNext", ctypes.c_void_p),
+                ("reserved", ctypes.c_size_t),
+            ]
+
+        winmm = ctypes.windll.winmm
+        winmm.waveOutOpen.argtypes = (
+            ctypes.POINTER(wintypes.HANDLE),
+            wintypes.UINT,
+            ctypes.POINTER(WAVEFORMATEX),
+            ctypes.c_size_t,
+            ctypes.c_size_t,
+            wintypes.DWORD,
+        )
+        for name in (
+            "waveOutPrepareHeader",
+            "waveOutUnprepareHeader",
+            "waveOutWrite",
+        ):
+            getattr(winmm, name).argtypes = (
+                wintypes.HANDLE,
+                ctypes.POINTER(WAVEHDR),
+                wintypes.UINT,
+            )
+        winmm.waveOutReset.argtypes = (wintypes.HANDLE,)
+        winmm.waveOutClose.argtypes = (wintypes.HANDLE,)
+
+        block_align = nchannels * sampwidth
+        fmt = WAVEFORMATEX(
+            1,  # WAVE_FORMAT_PCM
+            nchannels,
+            rate,
+            rate * block_align,
+            block_align,
+            sampwidth * 8,
+            0,
+        )
+        data = ctypes.create_string_buffer(frames, len(frames))
+        _winmm = winmm
+        for _ in range(_WIN_POOL_SIZE):
+            handle = wintypes.HANDLE()
+            # WAVE_MAPPER: the default output device, with no callback
+            if winmm.waveOutOpen(ctypes.byref(handle), 0xFFFFFFFF, fmt, 0, 0, 0):
+                _win_close()
+                return False
+            header = ctypes.pointer(
+                WAVEHDR(ctypes.addressof(data), len(frames))
+            )
+            size = ctypes.sizeof(WAVEHDR)
+            if winmm.waveOutPrepareHeader(handle, header, size):
+                # An unprepared header can never be written: leave it to MCI
+                winmm.waveOutClose(handle)
+                _win_close()
+                return False
+            _wave_out.append((handle, header, size))
+        _wave_data = data
+        return True
+
+    def _win_open(filepath):
+        """Open the audio file once under every pooled device"""
+        if _wave_open(filepath):
+            return
+
+        mci_send = _get_mci()
         safe_path = filepath.replace('"', '')
-        _mciSend(f'open "{safe_path}" type mpegvideo alias {alias}', None, 0, None)
-        _mciSend(f"play {alias} wait", None, 0, None)
-        _mciSend(f"close {alias}", None, 0, None)
+        for i in range(_WIN_POOL_SIZE):
+            mci_send(
+                f'open "{safe_path}" type mpegvideo alias fah_{i}', None, 0, None
+            )
+            # Built once here rather than formatted on every press
+            _mci_commands.append(
+                (f"seek fah_{i} to start".encode(), f"play fah_{i}".encode())
+            )
+
+    def _win_play():
+        """Restart the next pooled device from the top. Returns immediately."""
+        index = next(_mci_counter) % _WIN_POOL_SIZE
+        if _wave_out:
+            # The buffer goes straight to the driver; reset first so a
+            # device still playing its previous press starts over
+            handle, header, size = _wave_out[index]
+            _winmm.waveOutReset(handle)
+            result = _winmm.waveOutWrite(handle, header, size)
+            if result:
+                _log(f"Error playing audio: waveOutWrite failed ({result})")
+        else:
+            seek, play = _mci_commands[index]
+            _mciSendA(seek, None, 0, None)
+            _mciSendA(play, None, 0, None)
+
+    def _win_close():
+        """Close every pooled device"""
+        if _winmm is not None:
+            for handle, header, size in _wave_out:
+                _winmm.waveOutReset(handle)
+                _winmm.waveOutUnprepareHeader(handle, header, size)
+                _winmm.waveOutClose(handle)
+            _wave_out.clear()
+        if _mci_commands:
+            mci_send = _get_mci()
+            for i in range(_WIN_POOL_SIZE):
+                mci_send(f"close fah_{i}", None, 0, None)
+
+    # Virtual-key codes per config modifier; any code in a group counts
+    _VK_MODIFIERS = {
+        "ctrl": (0x11,),  # VK_CONTROL
+        "alt": (0x12,),  # VK_MENU
+        "shift": (0x10,),  # VK_SHIFT
+        "cmd": (0x5B, 0x5C),  # VK_LWIN, VK_RWIN
+        "win": (0x5B, 0x5C),
+    }
+
+    def _win_vk_groups(modifiers, key):
+        """VK code groups for the hotkey, main key first; None if unmappable"""
+        # A bare key is left to pynput's hook: the poller only polls quickly
+        # while a modifier is held, so it needs at least one
+        if not modifiers or len(key) != 1 or not key.isascii() or not key.isalnum():
+            return None
+        # Letters and digits use their upper-case ASCII code as the VK code
+        return [(ord(key.upper()),)] + [_VK_MODIFIERS[m.lower()] for m in modifiers]
+
+    def _win_poll_hotkey(vk_groups, on_activate, stop):
+        """Poll GetAsyncKeyState and fire on the press edge of the hotkey.
+
+        Only the modifiers are checked, every 50ms, until one of them is held;
+        then every key is polled about every 1ms with the timer resolution
+        raised, until the modifiers are released again.
+        """
+        import ctypes
+
+        get_key_state = ctypes.windll.user32.GetAsyncKeyState
+        get_key_state.argtypes = (ctypes.c_int,)
+        get_key_state.restype = ctypes.c_short
+        winmm = ctypes.windll.winmm
+
+        main_vks = vk_groups[0]
+        modifier_vks = [vk for group in vk_groups[1:] for vk in group]
+        fast = False
+        was_down = False
+        try:
+            while not stop.is_set():
+                armed = any(get_key_state(vk) & 0x8000 for vk in modifier_vks)
+                if armed != fast:
+                    # Event.wait() and sleep() round up to the ~15.6ms system
+                    # tick unless the resolution is raised
+                    fast = armed
+                    if fast:
+                        winmm.timeBeginPeriod(1)
+                    else:
+                        winmm.timeEndPeriod(1)
+                if not fast:
+                    was_down = False
+                    stop.wait(0.05)
+                    continue
+
+                down = any(get_key_state(vk) & 0x8000 for vk in main_vks) and all(
+                    any(get_key_state(vk) & 0x8000 for vk in group)
+                    for group in vk_groups[1:]
+                )
+                if down and not was_down:
+                    on_activate()
+                was_down = down
+                time.sleep(0.001)
+        finally:
+            if fast:
+                winmm.timeEndPeriod(1)
+
+
+class _MiniaudioPlayer:
+    """Plays decoded samples through a miniaudio device, mixing every press.
+
+    The device only runs while something is playing: a press starts it, and
+    after a second of silence it is stopped again so an idle listener costs
+    no audio callbacks and doesn't keep the sound server awake. The first
+    press after a pause pays for starting the stream.
+    """
+
+    def __init__(self, device, decoded):
+        self._device = device
+        self._samples = decoded.samples
+        self._nchannels = decoded.nchannels
+        # Frames of silence before the device is stopped; this also lets the
+        # last buffer drain before the stream goes away
+        self._linger = decoded.sample_rate
+        self._pending = deque()  # one entry per press not yet mixed in
+        self._lock = threading.Lock()
+        self._playing = False
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._control, daemon=True)
+        self._thread.start()
+
+    def play(self):
+        """Queue one more playback, starting the device if it is stopped"""
+        with self._lock:
+            self._pending.append(None)
+            if self._playing:
+                return
+            self._playing = True
+        self._wake.set()
+
+    def close(self):
+        """Stop and release the device"""
+        # Let the control thread finish any start/stop before the device goes
+        self._closed = True
+        self._wake.set()
+        self._idle.set()
+        self._thread.join()
+        self._device.close()
+
+    def _control(self):
+        """Start the device on demand and stop it once the mixer goes idle"""
+        import miniaudio
+
+        # miniaudio doesn't allow stopping a device from its own callback, so
+        # starts and stops happen on this thread
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            self._idle.clear()
+            mixer = self._mix()
+            next(mixer)
+            try:
+                self._device.start(mixer)
+            except miniaudio.MiniaudioError as e:
+                # e.g. the output device was unplugged: drop these presses
+                # and try again on the next one
+                self._reset(f"Error starting audio device: {e}")
+                continue
+            self._idle.wait()
+            if self._closed:
+                return
+            try:
+                self._device.stop()
+            except miniaudio.MiniaudioError as e:
+                self._reset(f"Error stopping audio device: {e}")
+
+    def _reset(self, message):
+        """Forget queued presses so the next one starts the device again"""
+        with self._lock:
+            self._pending.clear()
+            self._playing = False
+        _log(message)
+
+    def _mix(self):
+        """miniaudio playback generator mixing every press that is still playing"""
+        samples = self._samples
+        nchannels = self._nchannels
+        pending = self._pending
+        voices = []  # read offset into samples for each active press
+        silent = 0
+        framecount = yield b""
+        while True:
+            while pending:
+                pending.popleft()
+                voices.append(0)
+            if not voices:
+                silent += framecount
+                if silent >= self._linger:
+                    with self._lock:
+                        if not pending:
+                            # Presses from here on restart the device
+                            self._playing = False
+                            self._idle.set()
+                            return
+                    continue
+                # miniaudio pre-fills the buffer with silence
+                framecount = yield b""
+                continue
+
+            silent = 0
+            n = framecount * nchannels
+            chunks = [samples[pos : pos + n] for pos in voices]
+            voices = [pos + n for pos in voices if pos + n < len(samples)]
+            if len(chunks) == 1:
+                framecount = yield chunks[0]
+            else:
+                framecount = yield array.array(
+                    "h",
+                    [
+                        max(-32768, min(32767, sum(frame)))
+                        for frame in itertools.zip_longest(*chunks, fillvalue=0)
+                    ],
+                )
 
 
 class AudioHotkey:
     def __init__(self):
         """Initialize the audio hotkey listener"""
-        self.config = self.load_config()
-        self.setup_audio()
-        self.parse_keybind()
+        self._bootstrap()
+
+    def _bootstrap(self):
+        """Read the config once and set up audio and the keybind from it"""
+        # The parsed dict is not kept, so it can be freed before listening
+        config = self.load_config()
+        keybind_config = config.get("keybind", {})
+        # Per-press output is opt-in; printing from the hook adds latency
+        self._debug = bool(config.get("debug", False)) and not _QUIET
+        self.setup_audio(config.get("audio_file", "fah.mp3"))
+        try:
+            self.parse_keybind(
+                keybind_config.get("modifiers", []), keybind_config.get("key", "f")
+            )
+        except BaseException:
+            # An open audio device would otherwise keep the process from exiting
+            self.close()
+            raise
 
     def load_config(self):
         """Load configuration from the platform config directory"""
-        config_path = CONFIG_DIR / "config.yaml"
+        config_path = _CONFIG_PATH
+        # Parsed config is kept as JSON next to the YAML, tagged with the
+        # YAML's mtime and size; any difference (even an older mtime from a
+        # restored backup) means the cache is stale
+        cache_path = _CONFIG_CACHE_PATH
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-            return config
+            config_stat = config_path.stat()
         except FileNotFoundError:
-            print(f"Error: Configuration file not found at '{config_path}'")
-            print("Run the install script again to restore defaults.")
+            _log(f"Error: Configuration file not found at '{config_path}'")
+            _log("Run the install script again to restore defaults.")
+            sys.exit(1)
+        stamp = [config_stat.st_mtime_ns, config_stat.st_size]
+
+        try:
+            with open(cache_path, "rb") as f:
+                cached = json.load(f)
+            if cached["stamp"] == stamp:
+                return cached["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # Only pay for importing PyYAML when the cache is missing or stale
+        import yaml
+
+        # libyaml's C loader when PyYAML was built with it, same safe semantics
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        try:
+            with open(config_path, "rb") as f:
+                config = yaml.load(f, Loader=loader)
+        except FileNotFoundError:
+            _log(f"Error: Configuration file not found at '{config_path}'")
+            _log("Run the install script again to restore defaults.")
             sys.exit(1)
         except yaml.YAMLError as e:
-            print(f"Error parsing configuration file: {e}")
+            _log(f"Error parsing configuration file: {e}")
             sys.exit(1)
 
-    def setup_audio(self):
+        # Write to a temp file and rename so a crash never leaves half a cache
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"stamp": stamp, "config": config}, f)
+                os.replace(tmp_path, cache_path)
+            except (OSError, TypeError, ValueError):
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            # Read-only config dir or values JSON can't hold: parse every time
+            pass
+        return config
+
+    def setup_audio(self, audio_file):
         """Resolve the audio file and detect the system player"""
-        audio_file = self.config.get("audio_file", "fah.mp3")
+        audio_path = Path(audio_file)
 
-        if not os.path.isabs(audio_file):
-            audio_file = str(CONFIG_DIR / audio_file)
+        if not audio_path.is_absolute():
+            audio_path = CONFIG_DIR / audio_path
 
-        if not os.path.exists(audio_file):
-            print(f"Error: Audio file '{audio_file}' not found!")
-            print(f"Place your audio file at: {CONFIG_DIR / 'fah.mp3'}")
+        if not audio_path.is_file():
+            _log(f"Error: Audio file '{audio_path}' not found!")
+            _log(f"Place your audio file at: {_DEFAULT_AUDIO_PATH}")
             sys.exit(1)
 
+        audio_file = str(audio_path)
         self.audio_file = audio_file
-        self._linux_cmd = self._find_linux_player() if _SYSTEM == "Linux" else None
-        print(f"Audio file loaded: {audio_file}")
+        self.audio_basename = audio_path.name
+        self._play_msg = f"Playing audio: {self.audio_basename}\n"
+        self._miniaudio = None
+        self._trigger = None
+        if not self._start_miniaudio(audio_file):
+            self._setup_system_player(audio_file)
+        _log(f"Audio file loaded: {audio_file}")
+
+    def _start_miniaudio(self, audio_file):
+        """Decode the audio into memory and play it through miniaudio"""
+        # False means miniaudio is missing or failed: use the system player
+        try:
+            import miniaudio
+        except ImportError:
+            return False
+
+        try:
+            decoded = miniaudio.decode_file(audio_file)
+            device = miniaudio.PlaybackDevice(
+                nchannels=decoded.nchannels,
+                sample_rate=decoded.sample_rate,
+                buffersize_msec=30,
+            )
+        except miniaudio.MiniaudioError as e:
+            _log(f"Warning: miniaudio unavailable ({e}), using system player")
+            return False
+
+        self._miniaudio = _MiniaudioPlayer(device, decoded)
+        return True
+
+    def _setup_system_player(self, audio_file):
+        """Prepare MCI on Windows, or a playback worker on macOS/Linux"""
+        # Windows opens the file through MCI up front; elsewhere the full
+        # player command line is resolved once for the playback worker
+        self._play_argv = None
+        if _SYSTEM == "Windows":
+            _play_pool.submit(_win_open, audio_file).result()
+        elif _SYSTEM == "Darwin":
+            # mpv can stay running between presses; afplay is always present
+            mpv = shutil.which("mpv")
+            if mpv:
+                self._play_argv = [mpv, "--no-video", audio_file]
+            else:
+                self._play_argv = ["afplay", audio_file]
+        else:
+            linux_cmd = self._find_linux_player()
+            if linux_cmd:
+                self._play_argv = linux_cmd + [audio_file]
+
+        # A persistent worker drives the player, so a keypress costs one pipe
+        # write instead of a fork/exec on the keyboard hook thread
+        if self._play_argv is not None:
+            worker = subprocess.Popen(
+                [sys.executable, str(Path(__file__).with_name("_player.py"))]
+                + self._play_argv,
+                stdin=subprocess.PIPE,
+                bufsize=0,
+                # Keep Ctrl+C in the terminal from reaching the worker; it
+                # exits on its own once our end of the pipe closes
+                start_new_session=True,
+            )
+            self._trigger = worker.stdin
 
     def _find_linux_player(self):
         """Return a command list for playing audio on Linux."""
-        for player, extra in [
-            ("paplay", []),
-            ("aplay", []),
-            ("ffplay", ["-nodisp", "-autoexit"]),
-            ("mpg123", []),
-            ("mpv", ["--no-video"]),
-        ]:
-            if subprocess.run(
-                ["which", player], capture_output=True
-            ).returncode == 0:
-                return [player] + extra
-        print("Warning: no audio player found (install paplay, aplay, or ffplay)")
+        # The last hit is remembered per $PATH and candidate list, so later
+        # starts skip the scan
+        cache_path = _PLAYER_CACHE_PATH
+        search_path = os.environ.get("PATH", "")
+        candidates = [player for player, _ in _LINUX_PLAYERS]
+        try:
+            with open(cache_path, "rb") as f:
+                cached = json.load(f)
+            if (
+                cached["path"] == search_path
+                and cached["candidates"] == candidates
+                and os.path.isfile(cached["cmd"][0])
+                # A better-ranked player installed since then takes over
+                and not any(
+                    shutil.which(player)
+                    for player in candidates[: candidates.index(cached["player"])]
+                )
+            ):
+                return cached["cmd"]
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            pass
+
+        for player, extra in _LINUX_PLAYERS:
+            player_path = shutil.which(player)
+            if player_path:
+                cmd = [player_path] + extra
+                try:
+                    with open(cache_path, "w") as f:
+                        json.dump(
+                            {
+                                "path": search_path,
+                                "candidates": candidates,
+                                "player": player,
+                                "cmd": cmd,
+                            },
+                            f,
+                        )
+                except OSError:
+                    pass
+                return cmd
+        _log("Warning: no audio player found (install paplay, aplay, or ffplay)")
         return None
 
-    def parse_keybind(self):
+    def parse_keybind(self, modifiers, key):
         """Parse the keybind configuration"""
-        keybind_config = self.config.get("keybind", {})
-        modifiers = keybind_config.get("modifiers", [])
-        key = keybind_config.get("key", "f")
-
-        modifier_token_map = {
-            "ctrl": "<ctrl>",
-            "alt": "<alt>",
-            "shift": "<shift>",
-            "cmd": "<cmd>",
-            "win": "<cmd>",
-        }
-
         parts = []
         valid_modifiers = []
         for mod in modifiers:
             mod_lower = mod.lower()
-            if mod_lower in modifier_token_map:
-                parts.append(modifier_token_map[mod_lower])
+            if mod_lower in _MODIFIER_TOKEN_MAP:
+                parts.append(_MODIFIER_TOKEN_MAP[mod_lower])
                 valid_modifiers.append(mod)
         parts.append(key.lower())
         hotkey_str = "+".join(parts)
 
-        self.hotkey = keyboard.HotKey(
-            keyboard.HotKey.parse(hotkey_str),
-            self.play_audio,
-        )
+        # Windows polls the keys directly when they all have a VK code
+        self._vk_groups = None
+        if _SYSTEM == "Windows":
+            self._vk_groups = _win_vk_groups(valid_modifiers, key)
+
+        if self._vk_groups is None:
+            # pynput picks its platform backend on import, so defer it to here
+            from pynput import keyboard
+
+            # One bit per key of the combination, so matching a keystroke is
+            # a dict lookup and an int compare instead of HotKey's set logic
+            keys = keyboard.HotKey.parse(hotkey_str)
+            self._key_bits = {k: 1 << i for i, k in enumerate(keys)}
+            self._wanted_mask = (1 << len(keys)) - 1
 
         modifier_names = [m.capitalize() for m in valid_modifiers]
         self.keybind_display = "+".join(modifier_names + [key.upper()])
@@ -137,68 +663,111 @@ class AudioHotkey:
     def play_audio(self):
         """Play the audio file (non-blocking, allows overlapping)"""
         try:
-            if _SYSTEM == "Windows":
-                # MCI play blocks, so run in a daemon thread
-                threading.Thread(
-                    target=_win_play, args=(self.audio_file,), daemon=True
-                ).start()
-            elif _SYSTEM == "Darwin":
-                # afplay is always present on macOS
-                subprocess.Popen(
-                    ["afplay", self.audio_file],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+            if self._miniaudio is not None:
+                self._miniaudio.play()
+            elif _SYSTEM == "Windows":
+                # MCI calls can still take a few ms, keep them off the hook
+                _play_pool.submit(_win_play)
+            elif self._trigger is None:
+                _log("Error: no audio player available")
+                return
             else:
-                # Linux
-                if not self._linux_cmd:
-                    print("Error: no audio player available")
-                    return
-                subprocess.Popen(
-                    self._linux_cmd + [self.audio_file],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            print(f"Playing audio: {os.path.basename(self.audio_file)}")
+                self._trigger.write(b"\x01")
+            if self._debug:
+                sys.stdout.write(self._play_msg)
+                sys.stdout.flush()
         except Exception as e:
-            print(f"Error playing audio: {e}")
-
-    def on_press(self, key):
-        """Handle key press events"""
-        self.hotkey.press(self._listener.canonical(key))
-
-    def on_release(self, key):
-        """Handle key release events"""
-        self.hotkey.release(self._listener.canonical(key))
+            _log(f"Error playing audio: {e}")
 
     def run(self):
         """Start the global keyboard listener"""
-        print(f"\n{'=' * 50}")
-        print("Audio Hotkey Player Started")
-        print(f"{'=' * 50}")
-        print(f"Platform: {_SYSTEM}")
-        print(f"Hotkey: {self.keybind_display}")
-        print(f"Audio file: {os.path.basename(self.audio_file)}")
-        print(f"\nPress {self.keybind_display} to play audio")
-        print("Press Ctrl+C to stop")
-        print(f"{'=' * 50}\n")
+        _log(f"\n{'=' * 50}")
+        _log("Audio Hotkey Player Started")
+        _log(f"{'=' * 50}")
+        _log(f"Platform: {_SYSTEM}")
+        _log(f"Hotkey: {self.keybind_display}")
+        _log(f"Audio file: {self.audio_basename}")
+        _log(f"\nPress {self.keybind_display} to play audio")
+        _log("Press Ctrl+C to stop")
+        _log(f"{'=' * 50}\n")
 
         if _SYSTEM == "Darwin":
-            print("Note: On macOS, you may need to grant Accessibility permissions")
-            print(
+            _log("Note: On macOS, you may need to grant Accessibility permissions")
+            _log(
                 "to Terminal or Python in System Preferences > Security & Privacy\n"
             )
 
-        with keyboard.Listener(
-            on_press=self.on_press, on_release=self.on_release
-        ) as listener:
-            self._listener = listener
-            try:
+        try:
+            if self._vk_groups is not None:
+                self._poll_windows()
+            else:
+                self._listen()
+        finally:
+            self.close()
+        _log("\n\nStopping Audio Hotkey Player...")
+        _log("Goodbye!")
+
+    def close(self):
+        """Release the audio device opened by setup_audio"""
+        if self._miniaudio is not None:
+            self._miniaudio.close()
+        elif _SYSTEM == "Windows":
+            _play_pool.submit(_win_close).result()
+
+    def _listen(self):
+        """Run the pynput keyboard listener until Ctrl+C"""
+        from pynput import keyboard
+
+        # Bind the per-event state up front so each keystroke only touches
+        # closure locals rather than a chain of attribute lookups on self
+        key_bits = self._key_bits
+        wanted_mask = self._wanted_mask
+        play_audio = self.play_audio
+        mask = 0
+
+        def on_press(key):
+            nonlocal mask
+            bit = key_bits.get(canonical(key), 0)
+            # Fire on the press that completes the combination, not on repeats
+            if bit and not mask & bit:
+                mask |= bit
+                if mask == wanted_mask:
+                    play_audio()
+
+        def on_release(key):
+            nonlocal mask
+            mask &= ~key_bits.get(canonical(key), 0)
+
+        listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+        # canonical() normalises the key (e.g. Ctrl+F -> F) so it matches the
+        # parsed combination regardless of which modifiers are held.
+        canonical = listener.canonical
+
+        with listener:
+            # Ctrl+C stops the listener, which is what ends the join below
+            signal.signal(signal.SIGINT, lambda *_: listener.stop())
+            if _SYSTEM == "Windows":
+                # A blocking join can't be interrupted on Windows, so wake up
+                # periodically to let the SIGINT handler run
                 while listener.is_alive():
                     listener.join(timeout=1.0)
-            except KeyboardInterrupt:
-                print("\n\nStopping Audio Hotkey Player...")
-                print("Goodbye!")
+            else:
+                listener.join()
+
+    def _poll_windows(self):
+        """Run the GetAsyncKeyState polling thread until Ctrl+C"""
+        stop = threading.Event()
+        poller = threading.Thread(
+            target=_win_poll_hotkey,
+            args=(self._vk_groups, self.play_audio, stop),
+            daemon=True,
+        )
+        poller.start()
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        # A blocking join can't be interrupted on Windows, so wake up
+        # periodically to let the SIGINT handler run
+        while poller.is_alive():
+            poller.join(timeout=1.0)
 
 
 def main():
@@ -207,7 +776,7 @@ def main():
         hotkey = AudioHotkey()
         hotkey.run()
     except Exception as e:
-        print(f"Fatal error: {e}")
+        _log(f"Fatal error: {e}")
         sys.exit(1)
 
 
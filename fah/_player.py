@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Playback worker for fah (macOS/Linux)
+Started once by the hotkey listener; plays the audio once per byte read from stdin
+"""
+
+import itertools
+import os
+import selectors
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+# Paused mpv instances kept ready when mpv is the player; played round-robin
+# so presses can still overlap
+_MPV_POOL_SIZE = 4
+_MPV_REPLAY = (
+    b'{"command":["seek",0,"absolute"]}\n'
+    b'{"command":["set_property","pause",false]}\n'
+)
+
+
+def _start_mpv_pool(argv):
+    """Start idle mpv instances and connect to their IPC sockets.
+
+    Returns (processes, sockets, socket_dir), or None if mpv never came up.
+    """
+    sock_dir = tempfile.mkdtemp(prefix="fah-")
+    procs = []
+    sock_paths = []
+    for i in range(_MPV_POOL_SIZE):
+        sock_path = os.path.join(sock_dir, f"mpv{i}.sock")
+        procs.append(
+            subprocess.Popen(
+                argv[:-1]
+                + [
+                    "--idle=yes",
+                    "--keep-open=yes",
+                    "--pause",
+                    "--no-terminal",
+                    f"--input-ipc-server={sock_path}",
+                    argv[-1],
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        )
+        sock_paths.append(sock_path)
+
+    # mpv creates its socket shortly after starting
+    conns = []
+    deadline = time.monotonic() + 5.0
+    for sock_path in sock_paths:
+        while True:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                conn.connect(sock_path)
+                break
+            except OSError:
+                conn.close()
+                if time.monotonic() > deadline:
+                    for proc in procs:
+                        proc.terminate()
+                    for c in conns:
+                        c.close()
+                    shutil.rmtree(sock_dir, ignore_errors=True)
+                    return None
+                time.sleep(0.01)
+        conns.append(conn)
+    return procs, conns, sock_dir
+
+
+def _exit_on_signal(signum, frame):
+    """Raise SystemExit so the mpv pool is cleaned up when the worker is killed"""
+    sys.exit(128 + signum)
+
+
+def main(argv):
+    """Play the player command in argv for every trigger byte on stdin"""
+    signal.signal(signal.SIGTERM, _exit_on_signal)
+    signal.signal(signal.SIGHUP, _exit_on_signal)
+
+    devnull = os.open(os.devnull, os.O_RDWR)
+    file_actions = [(os.POSIX_SPAWN_DUP2, devnull, fd) for fd in (0, 1, 2)]
+    stdin = sys.stdin.buffer.raw
+
+    mpv_procs = []
+    mpv_conns = []
+    sock_dir = None
+    try:
+        if os.path.basename(argv[0]) == "mpv":
+            pool = _start_mpv_pool(argv)
+            if pool is not None:
+                mpv_procs, mpv_conns, sock_dir = pool
+        next_conn = itertools.cycle(mpv_conns)
+
+        # Let the kernel reap finished players so they never linger as
+        # zombies. Set after the pool is up: Popen children would inherit it,
+        # while posix_spawnp resets it below.
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+        selector = selectors.DefaultSelector()
+        selector.register(stdin, selectors.EVENT_READ)
+        for conn in mpv_conns:
+            selector.register(conn, selectors.EVENT_READ)
+
+        while True:
+            for key, _ in selector.select():
+                if key.fileobj is not stdin:
+                    # mpv replies and events are not needed, just drain them.
+                    # An instance that went away drops out of the rotation;
+                    # with none left, playback falls back to spawning mpv.
+                    try:
+                        alive = bool(key.fileobj.recv(4096))
+                    except OSError:
+                        alive = False
+                    if not alive:
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                        mpv_conns.remove(key.fileobj)
+                        next_conn = itertools.cycle(mpv_conns)
+                    continue
+
+                data = stdin.read(64)
+                if not data:
+                    # Listener exited and closed the pipe
+                    return
+                for _ in data:
+                    try:
+                        if mpv_conns:
+                            next(next_conn).sendall(_MPV_REPLAY)
+                        else:
+                            os.posix_spawnp(
+                                argv[0],
+                                argv,
+                                os.environ,
+                                file_actions=file_actions,
+                                setsigdef=(signal.SIGCHLD,),
+                            )
+                    except OSError as e:
+                        print(f"Error playing audio: {e}", file=sys.stderr)
+    finally:
+        for proc in mpv_procs:
+            proc.terminate()
+        if sock_dir is not None:
+            shutil.rmtree(sock_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])